@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
-import dataclasses
+import array
 import enum
-import functools
+import re
+import sys
+from typing import Iterator, NoReturn, overload
 
 from casbench.exception import InvalidLexemeError
 
+# Numbers directly followed by `.`, a letter or `_` fail to match and fall through to the
+# catch-all `invalid` group, which also ensures that no input is ever skipped by `finditer`.
+_TOKEN_RE = re.compile(
+    r"(?P<whitespace> +)"
+    r"|(?P<number>[0-9]+(?:\.[0-9]*)?(?![.\w]))"
+    r"|(?P<identifier>[A-Za-z][A-Za-z0-9_]*)"
+    r"|(?P<left_parenthesis>\()"
+    r"|(?P<right_parenthesis>\))"
+    r"|(?P<comma>,)"
+    r"|(?P<equal_equal>==)"
+    r"|(?P<invalid>.)",
+    re.DOTALL,
+)
+
+
+def _raise_invalid_lexeme(current: str, line: int, column: int, index: int) -> NoReturn:
+    """Raise ``InvalidLexemeError`` for an unrecognized/invalid lexeme."""
+    msg = (
+        f"Invalid lexeme {current} encountered on line {line} at "
+        f"column {column} (index {index}) during lexing"
+    )
+    raise InvalidLexemeError(msg)
+
 
 @enum.unique
-class TokenType(enum.Enum):
+class TokenType(enum.IntEnum):
     """Enumeration for token types to be encountered by the ``Lexer``."""
 
     identifier = enum.auto()
@@ -23,15 +48,131 @@ class TokenType(enum.Enum):
     end_of_file = enum.auto()
 
 
-@dataclasses.dataclass
 class Token:
     """Tokens and their associated data to be encountered by the ``Lexer``."""
 
-    token_type: TokenType
-    lexeme: str | None
-    line: int
-    column: int
-    literal: int | float | None = None
+    __slots__ = ("token_type", "lexeme", "line", "column", "literal")
+
+    def __init__(
+        self,
+        token_type: TokenType,
+        lexeme: str | None,
+        line: int,
+        column: int,
+        literal: int | float | None = None,
+    ) -> None:
+        """Initialize the ``Token`` with its type, lexeme, position and literal."""
+        self.token_type = token_type
+        self.lexeme = lexeme
+        self.line = line
+        self.column = column
+        self.literal = literal
+
+    def __repr__(self) -> str:
+        """Representation of the ``Token`` including all of its fields."""
+        return (
+            f"{self.__class__.__name__}(token_type={self.token_type!r}, "
+            f"lexeme={self.lexeme!r}, line={self.line!r}, column={self.column!r}, "
+            f"literal={self.literal!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """``Token`` instances are equal if all of their fields are equal."""
+        if not isinstance(other, Token):
+            return NotImplemented
+        return (
+            self.token_type == other.token_type
+            and self.lexeme == other.lexeme
+            and self.line == other.line
+            and self.column == other.column
+            and self.literal == other.literal
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class TokenStream:
+    """Sequence of ``Token`` data stored as parallel arrays, one per ``Token`` field.
+
+    Indexing or iterating reconstructs ``Token`` instances. These are snapshots: each
+    access returns a new ``Token``, and modifying it does not modify the stream. The
+    ``type_at`` and ``lexeme_at`` methods read a single field without constructing a
+    ``Token``.
+
+    """
+
+    __slots__ = ("types", "lexemes", "lines", "columns", "literals")
+
+    def __init__(self) -> None:
+        """Initialize an empty ``TokenStream``."""
+        self.types = array.array("B")
+        self.lexemes: list[str | None] = []
+        self.lines = array.array("q")
+        self.columns = array.array("q")
+        self.literals: list[int | float | None] = []
+
+    def type_at(self, index: int) -> TokenType:
+        """Return the token type of the token at ``index``."""
+        return _TOKEN_TYPES[self.types[index]]
+
+    def lexeme_at(self, index: int) -> str | None:
+        """Return the lexeme of the token at ``index``."""
+        return self.lexemes[index]
+
+    def __len__(self) -> int:
+        """Return the number of tokens in the stream."""
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> Token:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Token]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Token | list[Token]:
+        """Reconstruct the ``Token`` (or list of ``Token``) at ``index``."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Token(
+            token_type=_TOKEN_TYPES[self.types[index]],
+            lexeme=self.lexemes[index],
+            line=self.lines[index],
+            column=self.columns[index],
+            literal=self.literals[index],
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        """Iterate over the stream, reconstructing each ``Token``."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Streams are equal to other streams or lists containing equal tokens."""
+        if isinstance(other, TokenStream):
+            return (
+                self.types == other.types
+                and self.lexemes == other.lexemes
+                and self.lines == other.lines
+                and self.columns == other.columns
+                and self.literals == other.literals
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+_TOKEN_TYPES = {int(token_type): token_type for token_type in TokenType}
+
+_PUNCTUATION_TOKENS: dict[str | None, tuple[TokenType, str]] = {
+    "left_parenthesis": (TokenType.left_parenthesis, "("),
+    "right_parenthesis": (TokenType.right_parenthesis, ")"),
+    "comma": (TokenType.comma, ","),
+    "equal_equal": (TokenType.equal_equal, "=="),
+}
 
 
 class Lexer:
@@ -40,137 +181,79 @@ class Lexer:
     def __init__(self, source: str) -> None:
         """Initialize the ``Lexer`` with its ``source`` attribute."""
         self._source = source
+        self._tokens: TokenStream | None = None
 
     @property
     def source(self) -> str:
         """The source code to be tokenized by the lexer."""
         return self._source
 
-    @functools.cached_property
-    def tokens(self) -> list[Token]:
-        """The tokens encountered by the lexer during tokenization."""
-        return self._tokenize()
-
-    def _tokenize(self) -> list[Token]:
-        """Tokenize the source code into a series of ``Token`` objects."""
+    @property
+    def tokens(self) -> TokenStream:
+        """The ``TokenStream`` of tokens encountered by the lexer during tokenization."""
+        if self._tokens is None:
+            self._tokens = self._tokenize()
+        return self._tokens
 
-        def invalid_lexeme(current: str, line: int, column: int, index: int) -> None:
-            """Raise ``InvalidLexemeError`` for an unrecognized/invalid lexeme."""
-            msg = (
-                f"Invalid lexeme {current} encountered on line {line} at "
-                f"column {column} (index {index}) during lexing"
-            )
-            raise InvalidLexemeError(msg)
+    def _tokenize(self) -> TokenStream:
+        """Tokenize the source code into a ``TokenStream`` of ``Token`` data."""
+        source = self._source
+        punctuation_tokens = _PUNCTUATION_TOKENS
+        intern = sys.intern
 
         line = 0
-        column = 0
-        index = 0
-        literal = None
 
-        tokens = []
+        tokens = TokenStream()
+        types_append = tokens.types.append
+        lexemes_append = tokens.lexemes.append
+        lines_append = tokens.lines.append
+        columns_append = tokens.columns.append
+        literals_append = tokens.literals.append
 
-        while index < len(self.source):
-            current = self.source[index]
+        for match in _TOKEN_RE.finditer(source):
+            kind = match.lastgroup
 
             # Encountered whitespace that can be ignored (` `)
-            if current == " ":
-                column += 1
-                index += 1
+            if kind == "whitespace":
                 continue
 
-            # Encountered a candidate identifier
-            elif current.isalpha():
-                identifier = current
-                length = 1
-                while True:
-                    if (index + length) >= len(self.source):
-                        break
-                    peek = self.source[index + length]
-                    if not peek.isidentifier():
-                        break
-                    identifier += self.source[index + length]
-                    length += 1
+            column = match.start()
+
+            # Encountered an identifier
+            if kind == "identifier":
                 token_type = TokenType.identifier
-                lexeme = identifier
-
-            # Encountered a candidate number (integer_literal or float_literal)
-            elif current.isdigit():
-                number = current
-                length = 1
-                has_decimal_point = False
-                while True:
-                    if (index + length) >= len(self.source):
-                        break
-                    peek = self.source[index + length]
-                    if peek == ".":
-                        if has_decimal_point:
-                            invalid_lexeme(current, line, column, index)
-                        has_decimal_point = True
-                    elif peek.isalpha() or peek == "_":
-                        invalid_lexeme(current, line, column, index)
-                    elif peek.isnumeric():
-                        pass
-                    else:
-                        break
-                    number += peek
-                    length += 1
-                if has_decimal_point:
+                lexeme = intern(match.group())
+                literal = None
+
+            # Encountered a number (integer_literal or float_literal)
+            elif kind == "number":
+                lexeme = match.group()
+                if "." in lexeme:
                     token_type = TokenType.float_literal
-                    literal = float(number)
+                    literal = float(lexeme)
                 else:
                     token_type = TokenType.integer_literal
-                    literal = int(number)
-                lexeme = number
-
-            # Encountered a left parenthesis
-            elif current == "(":
-                token_type = TokenType.left_parenthesis
-                lexeme = "("
-                length = 1
-
-            # Encountered a right parenthesis
-            elif current == ")":
-                token_type = TokenType.right_parenthesis
-                lexeme = ")"
-                length = 1
-
-            # Encountered a comma
-            elif current == ",":
-                token_type=TokenType.comma
-                lexeme = ","
-                length = 1
-
-            # Encountered a candidate comparison operator (only == supported)
-            elif current == "=":
-                if self.source[index + 1] == "=":
-                    token_type = TokenType.equal_equal
-                    lexeme = "=="
-                    length = 2
-                else:
-                    invalid_lexeme(current, line, column, index)
+                    literal = int(lexeme)
 
             # No more possible valid token types
+            elif kind == "invalid":
+                _raise_invalid_lexeme(match.group(), line, column, column)
+
+            # Encountered punctuation (`(`, `)`, `,` or `==`)
             else:
-                invalid_lexeme(current, line, column, index)
-
-            token = Token(
-                token_type=token_type,
-                lexeme=lexeme,
-                line=line,
-                column=column,
-                literal=literal,
-            )
-            tokens.append(token)
-            column += length
-            index += length
-            literal = None
-
-        end_of_file_token = Token(
-            token_type=TokenType.end_of_file,
-            lexeme=None,
-            line=line,
-            column=column,
-        )
-        tokens.append(end_of_file_token)
+                token_type, lexeme = punctuation_tokens[kind]
+                literal = None
+
+            types_append(token_type)
+            lexemes_append(lexeme)
+            lines_append(line)
+            columns_append(column)
+            literals_append(literal)
+
+        types_append(TokenType.end_of_file)
+        lexemes_append(None)
+        lines_append(line)
+        columns_append(len(source))
+        literals_append(None)
 
         return tokens
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from casbench.exception import InvalidLexemeError
 from casbench.lexer import (
     Lexer,
     Token,
+    TokenStream,
     TokenType,
 )
 
@@ -32,6 +35,12 @@ class TestTokenType:
             assert hasattr(TokenType, expected_field)
         assert len(TokenType) == len(expected_fields)
 
+    @staticmethod
+    def test_members_are_integers() -> None:
+        """Enumeration members compare as distinct integers."""
+        assert all(isinstance(token_type, int) for token_type in TokenType)
+        assert len({int(token_type) for token_type in TokenType}) == len(TokenType)
+
 
 class TestToken:
     """Tests for the ``Token`` class."""
@@ -110,6 +119,73 @@ class TestToken:
         assert hasattr(token, "column")
         assert token.column == 0
 
+    @staticmethod
+    def test_token_equality() -> None:
+        """``Token`` instances compare equal only when all fields are equal."""
+        token = Token(TokenType.integer_literal, "1", line=0, column=0, literal=1)
+
+        assert token == Token(TokenType.integer_literal, "1", line=0, column=0, literal=1)
+        assert token != Token(TokenType.integer_literal, "1", line=0, column=1, literal=1)
+        assert token != Token(TokenType.float_literal, "1", line=0, column=0, literal=1)
+        assert not hasattr(token, "__dict__")
+
+
+class TestTokenStream:
+    """Tests for the ``TokenStream`` class."""
+
+    @staticmethod
+    def test_empty_stream() -> None:
+        """A new ``TokenStream`` contains no tokens."""
+        stream = TokenStream()
+        assert len(stream) == 0
+        assert list(stream) == []
+
+    @staticmethod
+    def test_field_accessors() -> None:
+        """Fields can be read without reconstructing ``Token`` instances."""
+        stream = Lexer("f(1.0)").tokens
+
+        assert len(stream) == 5
+        assert stream.type_at(0) is TokenType.identifier
+        assert stream.lexeme_at(0) == "f"
+        assert stream.type_at(2) is TokenType.float_literal
+        assert stream.lexeme_at(2) == "1.0"
+        assert stream.type_at(-1) is TokenType.end_of_file
+        assert stream.lexeme_at(-1) is None
+
+    @staticmethod
+    def test_getitem_reconstructs_tokens() -> None:
+        """Indexing and slicing a ``TokenStream`` reconstructs ``Token`` instances."""
+        stream = Lexer("f(1.0)").tokens
+
+        assert stream[2] == Token(TokenType.float_literal, "1.0", line=0, column=2, literal=1.0)
+        assert stream[-1] == Token(TokenType.end_of_file, None, line=0, column=6)
+        assert stream[:2] == [
+            Token(TokenType.identifier, "f", line=0, column=0),
+            Token(TokenType.left_parenthesis, "(", line=0, column=1),
+        ]
+
+    @staticmethod
+    def test_equality() -> None:
+        """Streams compare equal to streams and lists containing equal tokens."""
+        stream = Lexer("f(x)").tokens
+
+        assert stream == Lexer("f(x)").tokens
+        assert stream != Lexer("f(y)").tokens
+        assert stream == list(stream)
+
+    @staticmethod
+    def test_tokens_are_snapshots() -> None:
+        """Modifying a retrieved ``Token`` does not modify the ``TokenStream``."""
+        stream = Lexer("f(x)").tokens
+
+        token = stream[0]
+        token.lexeme = "g"
+
+        assert stream[0] is not token
+        assert stream.lexeme_at(0) == "f"
+        assert stream[0] == Token(TokenType.identifier, "f", line=0, column=0)
+
 
 class TestLexer:
     """Tests for the ``Lexer`` class."""
@@ -121,6 +197,16 @@ class TestLexer:
             "_",
             "0.0.0",
             "100_000",
+            "θ",
+            "x½",
+            "x²",
+            "½",
+            "²",
+            "Ⅻ",
+            "ⅰ",
+            "１",
+            "x١",
+            "=",
         ],
     )
     def test_invalid_syntax_raises_unexpected_token_error(source: str) -> None:
@@ -149,6 +235,13 @@ class TestLexer:
                     Token(TokenType.end_of_file, None, line=0, column=3),
                 ],
             ),
+            (
+                "x_1",
+                [
+                    Token(TokenType.identifier, "x_1", line=0, column=0),
+                    Token(TokenType.end_of_file, None, line=0, column=3),
+                ],
+            ),
             (
                 "0",
                 [
@@ -284,3 +377,29 @@ class TestLexer:
         """Multiple-token statements are tokenized correctly."""
         lexer = Lexer(source)
         assert lexer.tokens == expected_tokens
+
+    @staticmethod
+    def test_repeated_identifiers_share_lexeme() -> None:
+        """Repeated identifiers are interned so their lexemes are the same object."""
+        lexer = Lexer("diff(xy, xy)")
+        first_xy, second_xy = lexer.tokens[2], lexer.tokens[4]
+        assert first_xy.lexeme is sys.intern("".join(["x", "y"]))
+        assert first_xy.lexeme is second_xy.lexeme
+
+    @staticmethod
+    def test_tokens_are_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tokenization only occurs once, on first access of ``tokens``."""
+        calls: list[Lexer] = []
+        tokenize = Lexer._tokenize
+
+        def counting_tokenize(self: Lexer) -> TokenStream:
+            calls.append(self)
+            return tokenize(self)
+
+        monkeypatch.setattr(Lexer, "_tokenize", counting_tokenize)
+        lexer = Lexer("sin(x)")
+        first_tokens = lexer.tokens
+        second_tokens = lexer.tokens
+
+        assert first_tokens is second_tokens
+        assert len(calls) == 1